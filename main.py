@@ -7,7 +7,7 @@ Version: 1.0.0
 """
 
 import customtkinter as ctk
-from tkinter import filedialog, messagebox
+from tkinter import TclError, filedialog, messagebox
 import os
 import time
 from datetime import datetime
@@ -56,7 +56,7 @@ class CarpanoTool(ctk.CTk):
         # Set window icon (if available)
         try:
             self.iconbitmap("assets/icon.ico")
-        except:
+        except TclError:
             pass
         
         # Initialize tool modules
@@ -396,7 +396,7 @@ class CarpanoTool(ctk.CTk):
             # Run in thread
             def run_generation():
                 self.kg_progress.set(0.2)
-                start_time = time.time()
+                start_time = time.perf_counter()
                 
                 # Generate
                 keywords = self.keyword_gen.generate(lang, count, remove_dup)
@@ -410,7 +410,7 @@ class CarpanoTool(ctk.CTk):
                 
                 # Get statistics
                 stats = self.keyword_gen.get_statistics(keywords)
-                elapsed = time.time() - start_time
+                elapsed = time.perf_counter() - start_time
                 
                 self.kg_progress.set(1.0)
                 
@@ -559,7 +559,7 @@ File salvato: {filepath}
             
             def run_analysis():
                 self.pc_progress.set(0.2)
-                start_time = time.time()
+                start_time = time.perf_counter()
                 
                 # Analyze
                 results = self.password_checker.analyze_file(filepath)
@@ -580,7 +580,7 @@ File salvato: {filepath}
                 
                 # Get statistics
                 stats = self.password_checker.get_statistics(results)
-                elapsed = time.time() - start_time
+                elapsed = time.perf_counter() - start_time
                 
                 self.pc_progress.set(1.0)
                 
@@ -709,22 +709,20 @@ File creati:
             
             def run_removal():
                 self.dr_progress.set(0.2)
-                start_time = time.time()
+                start_time = time.perf_counter()
                 
-                # Process file
-                unique_lines, duplicates_removed = self.duplicate_remover.process_file(filepath)
-                self.dr_progress.set(0.6)
-                
-                # Save result
+                # Process file, streaming unique lines to the output
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 output_file = f"unique_{timestamp}.txt"
-                self.duplicate_remover.save_to_file(unique_lines, output_file)
+                unique_count, duplicates_removed = self.duplicate_remover.process_file_to_file(
+                    filepath, output_file
+                )
                 self.dr_progress.set(0.8)
                 
                 # Get statistics
-                original_count = len(unique_lines) + duplicates_removed
-                stats = self.duplicate_remover.get_statistics(original_count, len(unique_lines))
-                elapsed = time.time() - start_time
+                original_count = unique_count + duplicates_removed
+                stats = self.duplicate_remover.get_statistics(original_count, unique_count)
+                elapsed = time.perf_counter() - start_time
                 
                 self.dr_progress.set(1.0)
                 
@@ -892,7 +890,7 @@ File salvato: {output_file}
             
             def run_extraction():
                 self.ee_progress.set(0.2)
-                start_time = time.time()
+                start_time = time.perf_counter()
                 
                 # Extract emails
                 if mode == "Da file":
@@ -918,7 +916,7 @@ File salvato: {output_file}
                 
                 # Get statistics
                 stats = self.email_extractor.get_statistics(emails)
-                elapsed = time.time() - start_time
+                elapsed = time.perf_counter() - start_time
                 
                 self.ee_progress.set(1.0)
                 
@@ -1096,7 +1094,7 @@ Top 5 domini:
             
             def run_split():
                 self.ls_progress.set(0.2)
-                start_time = time.time()
+                start_time = time.perf_counter()
                 
                 # Split file
                 parts = self.list_splitter.process_file(filepath, split_mode, value)
@@ -1110,7 +1108,7 @@ Top 5 domini:
                 
                 # Get statistics
                 stats = self.list_splitter.get_statistics(parts)
-                elapsed = time.time() - start_time
+                elapsed = time.perf_counter() - start_time
                 
                 self.ls_progress.set(1.0)
                 
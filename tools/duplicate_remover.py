@@ -25,15 +25,8 @@ class DuplicateRemover:
         Returns:
             List of unique lines in original order
         """
-        seen: Set[str] = set()
-        unique_lines: List[str] = []
-        
-        for line in lines:
-            if line not in seen:
-                seen.add(line)
-                unique_lines.append(line)
-        
-        return unique_lines
+        # Dict keys keep first-insertion order, so this dedups in one C-level pass
+        return list(dict.fromkeys(lines))
     
     def process_file(self, filepath: str) -> tuple[List[str], int]:
         """
@@ -58,6 +51,38 @@ class DuplicateRemover:
         
         return unique_lines, duplicates_removed
     
+    def process_file_to_file(self, filepath: str, filename: str) -> tuple[int, int]:
+        """
+        Remove duplicates from a file, streaming unique lines to the output.
+        
+        Lines are written as soon as they are seen for the first time, so
+        the input is never loaded into memory as a whole.
+        
+        Args:
+            filepath: Path to the input file
+            filename: Output filename
+        
+        Returns:
+            Tuple of (number of unique lines, number of duplicates removed)
+        """
+        seen: Set[str] = set()
+        duplicates_removed = 0
+        
+        with open(filepath, 'r', encoding='utf-8', errors='ignore') as src, \
+                open(filename, 'w', encoding='utf-8') as dst:
+            for line in src:
+                line = line.strip()
+                if not line:
+                    continue
+                
+                if line in seen:
+                    duplicates_removed += 1
+                else:
+                    seen.add(line)
+                    dst.write(f"{line}\n")
+        
+        return len(seen), duplicates_removed
+    
     def save_to_file(self, lines: List[str], filename: str) -> str:
         """
         Save unique lines to file.
@@ -70,8 +95,7 @@ class DuplicateRemover:
             Path to saved file
         """
         with open(filename, 'w', encoding='utf-8') as f:
-            for line in lines:
-                f.write(f"{line}\n")
+            f.writelines(f"{line}\n" for line in lines)
         
         return filename
     
@@ -3,8 +3,10 @@ Email Extractor Module
 Extracts valid email addresses from text or files.
 """
 
+import heapq
 import re
-from typing import List, Set
+from operator import itemgetter
+from typing import Iterable, List, Set
 
 
 class EmailExtractor:
@@ -33,15 +35,7 @@ class EmailExtractor:
         emails = self.pattern.findall(text)
         
         if unique_only:
-            # Preserve order while removing duplicates
-            seen: Set[str] = set()
-            unique_emails: List[str] = []
-            for email in emails:
-                email_lower = email.lower()
-                if email_lower not in seen:
-                    seen.add(email_lower)
-                    unique_emails.append(email)
-            return unique_emails
+            return self._unique(emails)
         
         return emails
     
@@ -56,10 +50,34 @@ class EmailExtractor:
         Returns:
             List of extracted emails
         """
+        # Emails never span lines, so scan line by line instead of
+        # reading the whole file into memory
         with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            text = f.read()
+            emails = (email for line in f for email in self.pattern.findall(line))
+            
+            if unique_only:
+                return self._unique(emails)
+            
+            return list(emails)
+    
+    def _unique(self, emails: Iterable[str]) -> List[str]:
+        """
+        Remove case-insensitive duplicate emails while preserving order.
         
-        return self.extract_from_text(text, unique_only)
+        Args:
+            emails: Emails to deduplicate
+            
+        Returns:
+            List of unique emails, keeping the first spelling seen
+        """
+        seen: Set[str] = set()
+        unique_emails: List[str] = []
+        for email in emails:
+            email_lower = email.lower()
+            if email_lower not in seen:
+                seen.add(email_lower)
+                unique_emails.append(email)
+        return unique_emails
     
     def save_to_file(self, emails: List[str], filename: str) -> str:
         """
@@ -73,8 +91,7 @@ class EmailExtractor:
             Path to saved file
         """
         with open(filename, 'w', encoding='utf-8') as f:
-            for email in emails:
-                f.write(f"{email}\n")
+            f.writelines(f"{email}\n" for email in emails)
         
         return filename
     
@@ -107,7 +124,7 @@ class EmailExtractor:
         
         return {
             "total_emails": len(emails),
-            "unique_emails": len(set(email.lower() for email in emails)),
+            "unique_emails": len(set(map(str.lower, emails))),
             "unique_domains": len(domains),
-            "top_domains": sorted(domains.items(), key=lambda x: x[1], reverse=True)[:5]
+            "top_domains": heapq.nlargest(5, domains.items(), key=itemgetter(1))
         }
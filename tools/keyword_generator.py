@@ -5,7 +5,7 @@ Generates random keywords for different languages.
 
 import random
 import string
-from typing import List, Set
+from typing import List, Set, Tuple
 
 
 class KeywordGenerator:
@@ -48,7 +48,29 @@ class KeywordGenerator:
     
     def __init__(self):
         """Initialize the keyword generator."""
-        pass
+        # Resolve every pattern to its sequence of character pools once,
+        # so generation doesn't re-interpret "C"/"V" for each keyword
+        self._compiled_patterns = {
+            code: self._compile_patterns(lang_data)
+            for code, lang_data in self.LANGUAGES.items()
+        }
+    
+    @staticmethod
+    def _compile_patterns(lang_data: dict) -> List[Tuple[str, ...]]:
+        """
+        Translate a language's patterns into character pool sequences.
+        
+        Args:
+            lang_data: Language entry from LANGUAGES
+            
+        Returns:
+            One tuple of character pools per pattern
+        """
+        pools = {"C": lang_data["consonants"], "V": lang_data["vowels"]}
+        return [
+            tuple(pools[char] for char in pattern if char in pools)
+            for pattern in lang_data["common_patterns"]
+        ]
     
     def generate(self, language: str, count: int, remove_duplicates: bool = True) -> List[str]:
         """
@@ -65,12 +87,9 @@ class KeywordGenerator:
         if language not in self.LANGUAGES:
             raise ValueError(f"Unsupported language: {language}")
         
-        lang_data = self.LANGUAGES[language]
         keywords: Set[str] if remove_duplicates else List[str] = set() if remove_duplicates else []
         
-        consonants = lang_data["consonants"]
-        vowels = lang_data["vowels"]
-        patterns = lang_data["common_patterns"]
+        patterns = self._compiled_patterns[language]
         
         target_count = count * 2 if remove_duplicates else count
         
@@ -79,12 +98,7 @@ class KeywordGenerator:
             pattern = random.choice(patterns)
             
             # Generate keyword based on pattern
-            keyword = ""
-            for char in pattern:
-                if char == "C":
-                    keyword += random.choice(consonants)
-                elif char == "V":
-                    keyword += random.choice(vowels)
+            keyword = "".join([random.choice(pool) for pool in pattern])
             
             # Add random suffix (numbers)
             if random.random() < 0.3:  # 30% chance of adding numbers
@@ -119,13 +133,11 @@ class KeywordGenerator:
             filepath = f"{filename}.csv"
             with open(filepath, 'w', encoding='utf-8') as f:
                 f.write("keyword\n")  # CSV header
-                for keyword in keywords:
-                    f.write(f"{keyword}\n")
+                f.writelines(f"{keyword}\n" for keyword in keywords)
         else:
             filepath = f"{filename}.txt"
             with open(filepath, 'w', encoding='utf-8') as f:
-                for keyword in keywords:
-                    f.write(f"{keyword}\n")
+                f.writelines(f"{keyword}\n" for keyword in keywords)
         
         return filepath
     
@@ -140,9 +152,11 @@ class KeywordGenerator:
             Dictionary with statistics
         """
         total = len(keywords)
-        avg_length = sum(len(k) for k in keywords) / total if total > 0 else 0
-        min_length = min(len(k) for k in keywords) if total > 0 else 0
-        max_length = max(len(k) for k in keywords) if total > 0 else 0
+        # Measure every keyword once and derive all length metrics from it
+        lengths = list(map(len, keywords))
+        avg_length = sum(lengths) / total if total > 0 else 0
+        min_length = min(lengths) if total > 0 else 0
+        max_length = max(lengths) if total > 0 else 0
         
         return {
             "total": total,
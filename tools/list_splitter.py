@@ -98,8 +98,7 @@ class ListSplitter:
         for i, part in enumerate(parts, 1):
             filename = f"{base_filename}_part{i}.txt"
             with open(filename, 'w', encoding='utf-8') as f:
-                for line in part:
-                    f.write(f"{line}\n")
+                f.writelines(f"{line}\n" for line in part)
             created_files.append(filename)
         
         return created_files
@@ -114,9 +113,10 @@ class ListSplitter:
         Returns:
             Dictionary with statistics
         """
-        total_lines = sum(len(part) for part in parts)
-        min_lines = min(len(part) for part in parts) if parts else 0
-        max_lines = max(len(part) for part in parts) if parts else 0
+        sizes = list(map(len, parts))
+        total_lines = sum(sizes)
+        min_lines = min(sizes) if parts else 0
+        max_lines = max(sizes) if parts else 0
         avg_lines = total_lines / len(parts) if parts else 0
         
         return {
@@ -16,6 +16,12 @@ class PasswordChecker:
     MEDIUM = "MEDIUM"
     STRONG = "STRONG"
     
+    # Character class patterns, compiled once for every password checked
+    LOWER_PATTERN = re.compile(r'[a-z]')
+    UPPER_PATTERN = re.compile(r'[A-Z]')
+    DIGIT_PATTERN = re.compile(r'\d')
+    SPECIAL_PATTERN = re.compile(r'[^a-zA-Z0-9]')
+    
     def __init__(self):
         """Initialize the password checker."""
         pass
@@ -30,18 +36,17 @@ class PasswordChecker:
         Returns:
             Strength category (WEAK, MEDIUM, STRONG)
         """
-        if len(password) < 6:
-            return self.WEAK
-        
-        has_lower = bool(re.search(r'[a-z]', password))
-        has_upper = bool(re.search(r'[A-Z]', password))
-        has_digit = bool(re.search(r'\d', password))
-        has_special = bool(re.search(r'[^a-zA-Z0-9]', password))
+        length = len(password)
         
         # WEAK: < 6 chars, only letters or only numbers
-        if len(password) < 6:
+        if length < 6:
             return self.WEAK
         
+        has_lower = self.LOWER_PATTERN.search(password) is not None
+        has_upper = self.UPPER_PATTERN.search(password) is not None
+        has_digit = self.DIGIT_PATTERN.search(password) is not None
+        has_special = self.SPECIAL_PATTERN.search(password) is not None
+        
         if (has_lower or has_upper) and not has_digit and not has_special:
             return self.WEAK
         
@@ -49,16 +54,16 @@ class PasswordChecker:
             return self.WEAK
         
         # STRONG: > 8 chars with uppercase, lowercase, numbers, and symbols
-        if len(password) > 8 and has_lower and has_upper and has_digit and has_special:
+        if length > 8 and has_lower and has_upper and has_digit and has_special:
             return self.STRONG
         
         # MEDIUM: 6-8 chars with mix of letters and numbers
-        if 6 <= len(password) <= 8:
+        if 6 <= length <= 8:
             if (has_lower or has_upper) and has_digit:
                 return self.MEDIUM
         
         # Default to MEDIUM for anything in between
-        if len(password) > 8:
+        if length > 8:
             return self.MEDIUM
         
         return self.WEAK
@@ -86,13 +91,11 @@ class PasswordChecker:
                 if not line:
                     continue
                 
-                # Split by separator
-                parts = line.split(separator)
-                if len(parts) < 2:
+                # Everything after the first separator is the password
+                _, found, password = line.partition(separator)
+                if not found:
                     continue
                 
-                password = parts[1] if len(parts) == 2 else separator.join(parts[1:])
-                
                 # Check strength
                 strength = self.check_password_strength(password)
                 results[strength].append(line)
@@ -119,8 +122,7 @@ class PasswordChecker:
             # Save only strong passwords
             filename = f"{base_filename}_strong.txt"
             with open(filename, 'w', encoding='utf-8') as f:
-                for line in results[self.STRONG]:
-                    f.write(f"{line}\n")
+                f.writelines(f"{line}\n" for line in results[self.STRONG])
             created_files.append(filename)
         
         elif separate_files:
@@ -128,8 +130,7 @@ class PasswordChecker:
             for category in [self.WEAK, self.MEDIUM, self.STRONG]:
                 filename = f"{base_filename}_{category.lower()}.txt"
                 with open(filename, 'w', encoding='utf-8') as f:
-                    for line in results[category]:
-                        f.write(f"{line}\n")
+                    f.writelines(f"{line}\n" for line in results[category])
                 created_files.append(filename)
         
         else:
@@ -138,8 +139,7 @@ class PasswordChecker:
             with open(filename, 'w', encoding='utf-8') as f:
                 for category in [self.WEAK, self.MEDIUM, self.STRONG]:
                     f.write(f"=== {category} ===\n")
-                    for line in results[category]:
-                        f.write(f"{line}\n")
+                    f.writelines(f"{line}\n" for line in results[category])
                     f.write("\n")
             created_files.append(filename)
         